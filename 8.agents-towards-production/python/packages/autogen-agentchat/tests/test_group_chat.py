@@ -2,7 +2,7 @@ import asyncio
 import json
 import logging
 import tempfile
-from typing import Any, AsyncGenerator, Dict, List, Mapping, Sequence
+from typing import Any, AsyncGenerator, Dict, List, Mapping, MutableSequence, Sequence
 
 import pytest
 import pytest_asyncio
@@ -53,7 +53,7 @@ from autogen_core.models import (
 from autogen_core.tools import FunctionTool
 from autogen_ext.code_executors.local import LocalCommandLineCodeExecutor
 from autogen_ext.models.openai import OpenAIChatCompletionClient
-from autogen_ext.models.replay import ReplayChatCompletionClient
+from autogen_ext.models.replay import CreateCall, ReplayChatCompletionClient
 from pydantic import BaseModel
 from utils import FileLogHandler, compare_messages, compare_task_results
 
@@ -862,7 +862,7 @@ async def test_selector_group_chat_with_model_context(runtime: AgentRuntime | No
         "agent2: [Agent Two] Third generation",
     ]
 
-    create_calls: List[Dict[str, Any]] = selector_group_chat_model_client.create_calls
+    create_calls: MutableSequence[CreateCall] = selector_group_chat_model_client.create_calls
     for idx, call in enumerate(create_calls):
         messages = call["messages"]
         prompt = messages[0].content
@@ -1,5 +1,6 @@
-from ._replay_chat_completion_client import ReplayChatCompletionClient
+from ._replay_chat_completion_client import CreateCall, ReplayChatCompletionClient
 
 __all__ = [
+    "CreateCall",
     "ReplayChatCompletionClient",
 ]
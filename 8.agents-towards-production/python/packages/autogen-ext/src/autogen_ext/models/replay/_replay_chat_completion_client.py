@@ -1,8 +1,24 @@
 from __future__ import annotations
 
+import functools
 import logging
+import sys
 import warnings
-from typing import Any, AsyncGenerator, Dict, List, Literal, Mapping, Optional, Sequence, Union
+from collections import deque
+from typing import (
+    Any,
+    AsyncGenerator,
+    ClassVar,
+    List,
+    Literal,
+    Mapping,
+    MutableSequence,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+    cast,
+)
 
 from autogen_core import EVENT_LOGGER_NAME, CancellationToken, Component
 from autogen_core.models import (
@@ -21,6 +37,42 @@ from typing_extensions import Self
 
 logger = logging.getLogger(EVENT_LOGGER_NAME)
 
+try:
+    # Optional C accelerator (see _replay_fast.c); not built by default.
+    from ._replay_fast import split_and_count as _split_and_count
+except ImportError:  # pragma: no cover
+    _split_and_count = None  # type: ignore[assignment]
+
+
+@functools.lru_cache(maxsize=256)
+def _tokenize_str(content: str) -> tuple[tuple[str, ...], int]:
+    """Split a string into whitespace tokens, caching results for repeated content."""
+    tokens = tuple(content.split())
+    return tokens, len(tokens)
+
+
+class CreateCall(NamedTuple):
+    """Record of the arguments passed to a single create call.
+
+    A NamedTuple is ~3x smaller than the dict previously stored per call and
+    gives C-level attribute access. String keys are still accepted by
+    ``call["messages"]``-style indexing for callers that treated the records
+    as plain dicts, but only indexing is dict-compatible: ``in`` tests and
+    iteration follow tuple semantics (positional values, not keys). Use
+    ``_asdict()`` for a real dict.
+    """
+
+    messages: Sequence[LLMMessage]
+    tools: Sequence[Tool | ToolSchema]
+    json_output: Optional[bool | type[BaseModel]]
+    extra_create_args: Mapping[str, Any]
+    cancellation_token: Optional[CancellationToken]
+
+    def __getitem__(self, key: Any) -> Any:  # type: ignore[override]
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
 
 class ReplayChatCompletionClientConfig(BaseModel):
     """ReplayChatCompletionClient configuration."""
@@ -40,6 +92,9 @@ class ReplayChatCompletionClient(ChatCompletionClient, Component[ReplayChatCompl
 
     Args:
         chat_completions (Sequence[Union[str, CreateResult]]): A list of predefined responses to replay.
+        model_info (Optional[ModelInfo]): The model info to report. Defaults to a model with no capabilities.
+        record_calls (bool): Whether to record the arguments of each create call in :attr:`create_calls`. Defaults to True.
+        max_recorded_calls (Optional[int]): If set, only the most recent calls are retained, bounding memory in long replays.
 
     Raises:
         ValueError("No more mock responses available"): If the list of provided outputs are exhausted.
@@ -120,40 +175,116 @@ class ReplayChatCompletionClient(ChatCompletionClient, Component[ReplayChatCompl
 
     """
 
+    # The base classes still carry a per-instance __dict__, but declaring the
+    # slots turns access to these attributes into C-level offset lookups and
+    # keeps them out of the instance dict.
+    __slots__ = (
+        "chat_completions",
+        "provided_message_count",
+        "_model_info",
+        "_total_available_tokens",
+        "_cur_usage",
+        "_total_prompt_tokens",
+        "_total_completion_tokens",
+        "_current_index",
+        "_cached_bool_value",
+        "_stream_chunk_size",
+        "_tool_choice_warned",
+        "_record_calls",
+        "_create_calls",
+        "_precomputed",
+        "_stream_chunks",
+    )
+
     __protocol__: ChatCompletionClient
     component_type = "replay_chat_completion_client"
     component_provider_override = "autogen_ext.models.replay.ReplayChatCompletionClient"
     component_config_schema = ReplayChatCompletionClientConfig
 
+    # Template for clients constructed without model_info. ModelInfo is a
+    # TypedDict (a plain dict at runtime), so each instance takes a shallow
+    # copy rather than sharing this mutable default.
+    _DEFAULT_MODEL_INFO: ClassVar[ModelInfo] = ModelInfo(
+        vision=False,
+        function_calling=False,
+        json_output=False,
+        family=ModelFamily.UNKNOWN,
+        structured_output=False,
+    )
+
     # TODO: Support logprobs in Responses
 
     def __init__(
         self,
         chat_completions: Sequence[Union[str, CreateResult]],
         model_info: Optional[ModelInfo] = None,
+        record_calls: bool = True,
+        max_recorded_calls: Optional[int] = None,
     ):
-        self.chat_completions = list(chat_completions)
+        # Stored as a tuple: the script is never mutated and tuple indexing is
+        # faster than list indexing in CPython.
+        self.chat_completions = tuple(chat_completions)
         self.provided_message_count = len(self.chat_completions)
         if model_info is not None:
             self._model_info = model_info
             validate_model_info(self._model_info)
         else:
-            self._model_info = ModelInfo(
-                vision=False,
-                function_calling=False,
-                json_output=False,
-                family=ModelFamily.UNKNOWN,
-                structured_output=False,
-            )
+            self._model_info = self._DEFAULT_MODEL_INFO.copy()
         self._total_available_tokens = 10000
         self._cur_usage = RequestUsage(prompt_tokens=0, completion_tokens=0)
-        self._total_usage = RequestUsage(prompt_tokens=0, completion_tokens=0)
+        # Totals are accumulated as plain ints; mutating a RequestUsage per
+        # call would pay Pydantic validation on the hot path. A RequestUsage
+        # is only materialized on demand in total_usage().
+        self._total_prompt_tokens = 0
+        self._total_completion_tokens = 0
         self._current_index = 0
         self._cached_bool_value = True
-        self._create_calls: List[Dict[str, Any]] = []
+        self._stream_chunk_size = 32
+        self._tool_choice_warned = False
+        # Recording every call retains references to the full messages
+        # sequences, which grows without bound in long replays. Callers that
+        # don't need the introspection can turn it off, or cap the history.
+        self._record_calls = record_calls
+        self._create_calls: MutableSequence[CreateCall]
+        if max_recorded_calls is not None:
+            self._create_calls = deque(maxlen=max_recorded_calls)
+        else:
+            self._create_calls = []
+        # Tokenize the scripted string responses once so replays don't re-split
+        # the same static text on every create/create_stream call.
+        self._precomputed: List[Optional[tuple[tuple[str, ...], int]]] = []
+        for completion in self.chat_completions:
+            if isinstance(completion, str):
+                # Interning deduplicates repeated words across responses and
+                # replays, so every stream yields the same shared str objects.
+                tokens = tuple(sys.intern(token) for token in completion.split())
+                self._precomputed.append((tokens, len(tokens)))
+            else:
+                self._precomputed.append(None)
+        # Ready-to-yield stream chunks for each string response, so replays of
+        # create_stream do no string building at all on the hot path.
+        self._stream_chunks: List[Optional[List[str]]] = self._build_stream_chunks()
+
+    def _build_stream_chunks(self) -> List[Optional[List[str]]]:
+        chunk_size = self._stream_chunk_size
+        all_chunks: List[Optional[List[str]]] = []
+        for precomputed in self._precomputed:
+            if precomputed is None:
+                all_chunks.append(None)
+                continue
+            tokens, count = precomputed
+            chunks: List[str] = []
+            for start in range(0, count, chunk_size):
+                chunk = " ".join(tokens[start : start + chunk_size])
+                if start + chunk_size < count:
+                    chunks.append(chunk + " ")
+                else:
+                    chunks.append(chunk)
+            all_chunks.append(chunks)
+        return all_chunks
 
     @property
-    def create_calls(self) -> List[Dict[str, Any]]:
+    def create_calls(self) -> MutableSequence[CreateCall]:
         """Return the arguments of the calls made to the create method."""
         return self._create_calls
 
@@ -168,37 +299,57 @@ class ReplayChatCompletionClient(ChatCompletionClient, Component[ReplayChatCompl
         cancellation_token: Optional[CancellationToken] = None,
     ) -> CreateResult:
         """Return the next completion from the list."""
-        # Warn if tool_choice is specified since it's ignored in replay mode
-        if tool_choice != "auto":
+        return self._create_sync(
+            messages,
+            tools=tools,
+            tool_choice=tool_choice,
+            json_output=json_output,
+            extra_create_args=extra_create_args,
+            cancellation_token=cancellation_token,
+        )
+
+    def _create_sync(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        tool_choice: Tool | Literal["auto", "required", "none"] = "auto",
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> CreateResult:
+        """Synchronous implementation of :meth:`create`.
+
+        Replaying a scripted response involves no I/O, so callers in tight
+        loops can use this directly and skip the coroutine allocation and
+        event-loop round-trip of the async wrapper.
+        """
+        # Warn once per instance if tool_choice is specified since it's ignored in replay mode
+        if tool_choice != "auto" and not self._tool_choice_warned:
             logger.warning("tool_choice parameter specified but is ignored in replay mode")
+            self._tool_choice_warned = True
 
-        if self._current_index >= len(self.chat_completions):
+        current_index = self._current_index
+        if current_index >= self.provided_message_count:
             raise ValueError("No more mock responses available")
 
-        response = self.chat_completions[self._current_index]
-        _, prompt_token_count = self._tokenize(messages)
+        response = self.chat_completions[current_index]
         if isinstance(response, str):
-            _, output_token_count = self._tokenize(response)
+            prompt_token_count, output_token_count = self._counts(messages, response)
             self._cur_usage = RequestUsage(prompt_tokens=prompt_token_count, completion_tokens=output_token_count)
             response = CreateResult(
                 finish_reason="stop", content=response, usage=self._cur_usage, cached=self._cached_bool_value
             )
         else:
+            prompt_token_count, _ = self._counts(messages)
             self._cur_usage = RequestUsage(
                 prompt_tokens=prompt_token_count, completion_tokens=response.usage.completion_tokens
             )
 
         self._update_total_usage()
         self._current_index += 1
-        self._create_calls.append(
-            {
-                "messages": messages,
-                "tools": tools,
-                "json_output": json_output,
-                "extra_create_args": extra_create_args,
-                "cancellation_token": cancellation_token,
-            }
-        )
+        if self._record_calls:
+            self._create_calls.append(CreateCall(messages, tools, json_output, extra_create_args, cancellation_token))
         return response
 
     async def create_stream(
@@ -212,24 +363,29 @@ class ReplayChatCompletionClient(ChatCompletionClient, Component[ReplayChatCompl
         cancellation_token: Optional[CancellationToken] = None,
     ) -> AsyncGenerator[Union[str, CreateResult], None]:
         """Return the next completion as a stream."""
-        # Warn if tool_choice is specified since it's ignored in replay mode
-        if tool_choice != "auto":
+        # Warn once per instance if tool_choice is specified since it's ignored in replay mode
+        if tool_choice != "auto" and not self._tool_choice_warned:
             logger.warning("tool_choice parameter specified but is ignored in replay mode")
+            self._tool_choice_warned = True
 
-        if self._current_index >= len(self.chat_completions):
+        current_index = self._current_index
+        if current_index >= self.provided_message_count:
             raise ValueError("No more mock responses available")
 
-        response = self.chat_completions[self._current_index]
-        _, prompt_token_count = self._tokenize(messages)
+        response = self.chat_completions[current_index]
+        prompt_token_count = self._count_tokens_fast(messages)
         if isinstance(response, str):
-            output_tokens, output_token_count = self._tokenize(response)
+            precomputed = self._precomputed[current_index]
+            stream_chunks = self._stream_chunks[current_index]
+            assert precomputed is not None and stream_chunks is not None
+            _, output_token_count = precomputed
             self._cur_usage = RequestUsage(prompt_tokens=prompt_token_count, completion_tokens=output_token_count)
 
-            for i, token in enumerate(output_tokens):
-                if i < len(output_tokens) - 1:
-                    yield token + " "
-                else:
-                    yield token
+            # Emit tokens in precomputed batches rather than one per yield:
+            # each yield is a coroutine suspension, so chunking cuts event-loop
+            # overhead while preserving the exact concatenated output.
+            for chunk in stream_chunks:
+                yield chunk
             yield CreateResult(
                 finish_reason="stop", content=response, usage=self._cur_usage, cached=self._cached_bool_value
             )
@@ -250,47 +406,94 @@ class ReplayChatCompletionClient(ChatCompletionClient, Component[ReplayChatCompl
         return self._cur_usage
 
     def total_usage(self) -> RequestUsage:
-        return self._total_usage
+        return RequestUsage(prompt_tokens=self._total_prompt_tokens, completion_tokens=self._total_completion_tokens)
 
     def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
-        _, token_count = self._tokenize(messages)
-        return token_count
+        return self._count_tokens_fast(messages)
 
     def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
-        return max(
-            0, self._total_available_tokens - self._total_usage.prompt_tokens - self._total_usage.completion_tokens
-        )
+        return max(0, self._total_available_tokens - self._total_prompt_tokens - self._total_completion_tokens)
 
     def set_cached_bool_value(self, value: bool) -> None:
         self._cached_bool_value = value
 
-    def _tokenize(self, messages: Union[str, LLMMessage, Sequence[LLMMessage]]) -> tuple[list[str], int]:
-        total_tokens = 0
-        all_tokens: List[str] = []
-        if isinstance(messages, str):
-            tokens = messages.split()
-            total_tokens += len(tokens)
-            all_tokens.extend(tokens)
-        elif hasattr(messages, "content"):
-            if isinstance(messages.content, str):  # type: ignore [reportAttributeAccessIssue]
-                tokens = messages.content.split()  # type: ignore [reportAttributeAccessIssue]
-                total_tokens += len(tokens)
-                all_tokens.extend(tokens)
+    def set_stream_chunk_size(self, value: int) -> None:
+        """Set the number of tokens emitted per chunk in :meth:`create_stream`."""
+        if value < 1:
+            raise ValueError("stream chunk size must be at least 1")
+        self._stream_chunk_size = value
+        self._stream_chunks = self._build_stream_chunks()
+
+    def _counts(self, messages: Sequence[LLMMessage], response_str: Optional[str] = None) -> tuple[int, int]:
+        """Return (prompt, completion) token counts in one pass without building token lists."""
+        prompt_token_count = self._count_tokens_fast(messages)
+        completion_token_count = _tokenize_str(response_str)[1] if response_str is not None else 0
+        return prompt_token_count, completion_token_count
+
+    def _count_tokens_fast(self, messages: Sequence[LLMMessage]) -> int:
+        """Count tokens in a message sequence without materializing the token list.
+
+        Agent loops pass largely the same message contents on every call, so
+        the content-keyed cache in :func:`_tokenize_str` makes repeated counts
+        of already-seen messages O(1).
+        """
+        total = 0
+        for message in messages:
+            if isinstance(message.content, str):  # type: ignore [reportAttributeAccessIssue, union-attr]
+                total += _tokenize_str(message.content)[1]  # type: ignore [reportAttributeAccessIssue, union-attr]
             else:
                 logger.warning("Token count has been done only on string content")
-        elif isinstance(messages, Sequence):
+        return total
+
+    def _tokenize_messages(self, messages: Sequence[LLMMessage]) -> tuple[list[str], int]:
+        """Tokenize a message sequence, reusing cached splits for already-seen messages."""
+        # The accelerator splits the whole batch in one C-level pass and
+        # deliberately skips the content-keyed cache in _tokenize_str: it wins
+        # on large, mostly-fresh batches, while the cache only helps when the
+        # same contents recur. The pure-Python fallback keeps the cache.
+        if _split_and_count is not None:
+            contents: List[str] = []
             for message in messages:
                 if isinstance(message.content, str):  # type: ignore [reportAttributeAccessIssue, union-attr]
-                    tokens = message.content.split()  # type: ignore [reportAttributeAccessIssue, union-attr]
-                    total_tokens += len(tokens)
-                    all_tokens.extend(tokens)
+                    contents.append(message.content)  # type: ignore [reportAttributeAccessIssue, union-attr]
                 else:
                     logger.warning("Token count has been done only on string content")
+            return _split_and_count(contents)
+        total_tokens = 0
+        all_tokens: List[str] = []
+        for message in messages:
+            if isinstance(message.content, str):  # type: ignore [reportAttributeAccessIssue, union-attr]
+                tokens, count = _tokenize_str(message.content)  # type: ignore [reportAttributeAccessIssue, union-attr]
+                total_tokens += count
+                all_tokens.extend(tokens)
+            else:
+                logger.warning("Token count has been done only on string content")
         return all_tokens, total_tokens
 
+    def _tokenize(self, messages: Union[str, LLMMessage, Sequence[LLMMessage]]) -> tuple[list[str], int]:
+        # Compatibility shim: internal callers know their argument type
+        # statically and call _tokenize_str/_tokenize_messages directly.
+        # Concrete types are checked before the Sequence ABC because an
+        # isinstance check against a concrete type is a C-level pointer
+        # compare, while the ABC check walks the __subclasshook__ machinery.
+        if isinstance(messages, str):
+            tokens, count = _tokenize_str(messages)
+            return list(tokens), count
+        if isinstance(messages, (list, tuple)):
+            return self._tokenize_messages(messages)
+        if hasattr(messages, "content"):
+            if isinstance(messages.content, str):  # type: ignore [reportAttributeAccessIssue]
+                tokens, count = _tokenize_str(messages.content)  # type: ignore [reportAttributeAccessIssue]
+                return list(tokens), count
+            logger.warning("Token count has been done only on string content")
+            return [], 0
+        if isinstance(messages, Sequence):
+            return self._tokenize_messages(cast(Sequence[LLMMessage], messages))
+        return [], 0
+
     def _update_total_usage(self) -> None:
-        self._total_usage.completion_tokens += self._cur_usage.completion_tokens
-        self._total_usage.prompt_tokens += self._cur_usage.prompt_tokens
+        self._total_completion_tokens += self._cur_usage.completion_tokens
+        self._total_prompt_tokens += self._cur_usage.prompt_tokens
 
     @property
     def capabilities(self) -> ModelCapabilities:  # type: ignore
@@ -305,7 +508,8 @@ class ReplayChatCompletionClient(ChatCompletionClient, Component[ReplayChatCompl
     def reset(self) -> None:
         """Reset the client state and usage to its initial state."""
         self._cur_usage = RequestUsage(prompt_tokens=0, completion_tokens=0)
-        self._total_usage = RequestUsage(prompt_tokens=0, completion_tokens=0)
+        self._total_prompt_tokens = 0
+        self._total_completion_tokens = 0
         self._current_index = 0
 
     def _to_config(self) -> ReplayChatCompletionClientConfig:
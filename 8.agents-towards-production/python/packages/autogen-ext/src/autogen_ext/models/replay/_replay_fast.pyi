@@ -0,0 +1,3 @@
+from typing import List, Tuple
+
+def split_and_count(contents: List[str]) -> Tuple[List[str], int]: ...
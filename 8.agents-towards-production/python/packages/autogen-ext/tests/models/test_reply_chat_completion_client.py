@@ -158,6 +158,61 @@ async def test_token_count_logics() -> None:
     assert after_create_stream_usage.prompt_tokens > before_cteate_stream_usage.prompt_tokens
 
 
+@pytest.mark.asyncio
+async def test_replay_chat_completion_client_record_calls() -> None:
+    """Test that call recording can be disabled via record_calls=False."""
+    messages = [UserMessage(content="dummy", source="_")]
+
+    recording_client = ReplayChatCompletionClient(["First", "Second"])
+    await recording_client.create(messages)
+    assert len(recording_client.create_calls) == 1
+    assert recording_client.create_calls[0].messages is messages
+    assert recording_client.create_calls[0]["messages"] is messages
+
+    non_recording_client = ReplayChatCompletionClient(["First", "Second"], record_calls=False)
+    await non_recording_client.create(messages)
+    await non_recording_client.create(messages)
+    assert len(non_recording_client.create_calls) == 0
+
+
+@pytest.mark.asyncio
+async def test_replay_chat_completion_client_max_recorded_calls() -> None:
+    """Test that max_recorded_calls keeps only the most recent calls."""
+    client = ReplayChatCompletionClient([f"Message {i}" for i in range(5)], max_recorded_calls=2)
+
+    dummy_messages = [[UserMessage(content=f"dummy {i}", source="_")] for i in range(5)]
+    for messages in dummy_messages:
+        await client.create(messages)
+
+    assert len(client.create_calls) == 2
+    assert [call.messages for call in client.create_calls] == dummy_messages[3:]
+
+
+@pytest.mark.asyncio
+async def test_replay_chat_completion_client_stream_chunk_size() -> None:
+    """Test that a non-default chunk size still reassembles to the original string."""
+    num_messages = 3
+    messages = [f"Stream message number {i} with several more tokens" for i in range(num_messages)]
+    client = ReplayChatCompletionClient(messages)
+    client.set_stream_chunk_size(2)
+
+    for i in range(num_messages):
+        chunks: List[str] = []
+        result: CreateResult | None = None
+        async for completion in client.create_stream([UserMessage(content="dummy", source="_")]):
+            if isinstance(completion, CreateResult):
+                result = completion
+            else:
+                assert isinstance(completion, str)
+                chunks.append(completion)
+        assert result is not None
+        assert len(chunks) > 1
+        assert "".join(chunks) == messages[i] == result.content
+
+    with pytest.raises(ValueError, match="stream chunk size must be at least 1"):
+        client.set_stream_chunk_size(0)
+
+
 @pytest.mark.asyncio
 async def test_replay_chat_completion_client_reset() -> None:
     """Test that reset functionality properly resets the client state."""